@@ -6,14 +6,262 @@ Attributes:
 
 """
 
+import contextlib
+import functools
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Union, List, Dict, Mapping, Any
-import dateutil.parser
+from operator import itemgetter
+from typing import Optional, Union, List, Dict, Mapping, Any, Tuple
+from urllib.parse import quote_plus, urlencode
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    from json import loads as _loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    # Advertised (and transparently decoded by urllib3) only when a brotli
+    # decoder is importable; gzip is always safe to offer.
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    # urllib3 2.x decodes zstd transparently, but only when the zstandard
+    # package is present; never advertise what we cannot decode.
+    import zstandard  # noqa: F401
+    import urllib3
+
+    if int(urllib3.__version__.split(".", 1)[0]) >= 2:
+        _ACCEPT_ENCODING = f"zstd, {_ACCEPT_ENCODING}"
+except ImportError:
+    pass
 
 
 DEFAULT_API_VERSION = 1
 
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Prebuilt bodies for the two connected-state writes every session makes.
+_CONN_BODIES = {True: b"Connected=True", False: b"Connected=False"}
+
+# Splits a comma-separated driver-info string and eats surrounding
+# whitespace in one compiled pass.
+_DRIVERINFO_SPLIT = re.compile(r"\s*,\s*").split
+
+# C-level accessor for the envelope field every successful call reads.
+_VALUE = itemgetter("Value")
+
+
+# Encoders for the types utcdate() accepts, dispatched on exact type.
+# Subclasses miss this table; utcdate() falls back to isinstance for them.
+_UTC_ENCODERS = {str: str, datetime: datetime.isoformat}
+
+
+# Fractional-second field of an ISO timestamp, for padding or truncating
+# to the 6 digits every supported fromisoformat accepts.
+_ISO_FRACTION = re.compile(r"\.(\d+)")
+
+
+def _six_digit_fraction(match: "re.Match") -> str:
+    return "." + match.group(1)[:6].ljust(6, "0")
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp from an Alpaca server.
+
+    Well-formed timestamps take the C-implemented fromisoformat path.
+    Pythons before 3.11 only accept 3- or 6-digit fractions there, while
+    Alpaca servers emit .NET ticks (7 digits), so on failure the fraction
+    is normalized to 6 digits and retried before falling back to the
+    optional python-dateutil package.
+
+    Args:
+        value (str): Timestamp to parse.
+
+    """
+    value = value.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(
+            _ISO_FRACTION.sub(_six_digit_fraction, value, count=1)
+        )
+    except ValueError:
+        # Imported only on the fallback path; dateutil is an optional
+        # install (pip install Alpyca[dateutil]) most clients never need.
+        import dateutil.parser
+
+        return dateutil.parser.isoparse(value)
+
+
+# Endpoints shared by every device type, prebuilt into the URL cache at
+# construction so the common calls never pay the format-and-fill branch.
+_DEVICE_ENDPOINTS = (
+    "action",
+    "commandblind",
+    "commandbool",
+    "commandstring",
+    "connected",
+    "description",
+    "driverinfo",
+    "driverversion",
+    "interfaceversion",
+    "name",
+    "supportedactions",
+)
+
+
+# Sessions shared by every Device talking to the same origin, so a mount,
+# camera and focuser exposed by one driver host reuse one connection pool.
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Transient 5xx blips and connection resets retry on the pooled socket
+# with short exponential backoff instead of surfacing to every caller.
+# Alpaca GETs and PUTs are idempotent at the HTTP layer, so retrying
+# both verbs is safe.
+_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(("GET", "PUT")),
+)
+
+# Disable Nagle so the many tiny PUT bodies (pulseguide, moveaxis) are
+# not held back waiting for ACKs, and keep idle sockets probed alive.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _AlpacaAdapter(HTTPAdapter):
+    """HTTPAdapter that applies the low-latency socket options."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Initialize the pool manager with Alpaca socket options."""
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _session_for(address: str, protocall: str) -> requests.Session:
+    """Return the pooled session shared by all devices on one server.
+
+    Args:
+        address (str): Domain name or IP address of Alpaca server.
+        protocall (str): Protocol (http vs https) used to communicate with
+        Alpaca server.
+
+    """
+    origin = f"{protocall}://{address}"
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(origin)
+        if session is None:
+            session = requests.Session()
+            session.mount(
+                f"{protocall}://",
+                _AlpacaAdapter(
+                    pool_connections=4, pool_maxsize=32, max_retries=_RETRIES
+                ),
+            )
+            _SESSIONS[origin] = session
+    return session
+
+
+def close_all_sessions():
+    """Close every shared session, e.g. at application shutdown."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+def _decode(response):
+    """Parse a response body, honoring msgpack content negotiation.
+
+    Servers that accept the msgpack offer skip the number-to-text round
+    trip of JSON, which dominates for large numeric payloads like
+    imagearray. Everything else goes through the JSON fast path.
+
+    Args:
+        response: Response from the Alpaca server to parse.
+
+    """
+    if msgpack is not None and response.headers.get("Content-Type", "").startswith(
+        "application/msgpack"
+    ):
+        return msgpack.unpackb(response.content, raw=False)
+    return _loads(response.content)
+
+
+def _cached(fn):
+    """Cache the result of an immutable getter per device instance.
+
+    Only suitable for methods whose value cannot change for the life of a
+    device session (capabilities, driver metadata). The cache is cleared
+    by Device.invalidate_cache().
+
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        cache = self._cap_cache
+        if key not in cache:
+            cache[key] = fn(self, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+def _capability_getter(attribute: str, summary: str, returns: str):
+    """Build a cached capability getter for a fixed Alpaca attribute.
+
+    Args:
+        attribute (str): Attribute to get from server.
+        summary (str): One-line summary for the generated docstring.
+        returns (str): Returns text for the generated docstring.
+
+    """
+
+    def getter(self) -> bool:
+        return self._get(attribute)
+
+    getter.__name__ = attribute
+    getter.__qualname__ = f"Telescope.{attribute}"
+    getter.__doc__ = f"{summary}\n\n        Returns:\n            {returns}\n\n        "
+    return _cached(getter)
+
 
 class Device:
     """Common methods across all ASCOM Alpaca devices.
@@ -25,12 +273,49 @@ class Device:
             e.g. telescope (must be lower case).
         device_number (int): Zero based device number as set on the server (0 to
             4294967295).
-        protocall (str): Protocall used to communicate with Alpaca server.
         api_version (int): Alpaca API version.
         base_url (str): Basic URL to easily append with commands.
+        keep_alive (bool): Reuse one pooled connection across calls. Set
+            False for one-shot scripts, where the session machinery is pure
+            overhead and each request should close its connection.
+        ttl_cache (Mapping[str, float]): Optional map of attribute name to
+            time-to-live in seconds. Reads of a listed attribute within its
+            window return the last value without touching the network,
+            which tames UI polling loops. Use invalidate() to force a
+            fresh read.
+        session (requests.Session): Optional externally managed session to
+            send requests through, e.g. one shared with non-Alpaca traffic.
+            The caller is responsible for closing it.
+        lock (bool): Serialize writes to the device. Many mounts drop or
+            corrupt overlapping commands; set False only for devices proven
+            to handle concurrent requests.
 
     """
 
+    __slots__ = (
+        "address",
+        "device_type",
+        "device_number",
+        "api_version",
+        "base_url",
+        "keep_alive",
+        "_session",
+        "_owns_session",
+        "_headers",
+        "_form_headers",
+        "_url_cache",
+        "_prepped",
+        "_prepped_puts",
+        "_send_kwargs",
+        "_cap_cache",
+        "_ttls",
+        "_ttl_cache",
+        "_pool",
+        "_pending",
+        "_last_utc",
+        "_lock",
+    )
+
     def __init__(
         self,
         address: str,
@@ -38,19 +323,152 @@ class Device:
         device_number: int,
         protocall: str,
         api_version: int,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize Device object."""
         self.address = address
         self.device_type = device_type
         self.device_number = device_number
         self.api_version = api_version
-        self.base_url = "%s://%s/api/v%d/%s/%d" % (
-            protocall,
-            address,
-            api_version,
-            device_type,
-            device_number,
+        self.base_url = (
+            f"{protocall}://{address}/api/v{api_version}/{device_type}/{device_number}"
         )
+        self.keep_alive = keep_alive
+        self._session = None
+        self._owns_session = False
+        if session is not None:
+            # Caller-supplied session; the caller manages its lifecycle.
+            self._session = session
+        elif not keep_alive:
+            # Plain per-call requests; the server closes the connection.
+            self._session = requests
+        elif httpx is not None:
+            try:
+                # HTTP/2 multiplexes concurrent Alpaca calls on one connection.
+                self._session = httpx.Client(http2=True, timeout=None)
+                self._owns_session = True
+            except ImportError:  # httpx installed without the http2 extra.
+                pass
+        if self._session is None:
+            self._session = _session_for(address, protocall)
+        if keep_alive:
+            self._headers = None
+            self._form_headers = _FORM_HEADERS
+        else:
+            self._headers = {"Connection": "close"}
+            self._form_headers = {**_FORM_HEADERS, "Connection": "close"}
+        if msgpack is not None:
+            accept = {"Accept": "application/msgpack, application/json;q=0.5"}
+            self._headers = {**(self._headers or {}), **accept}
+            self._form_headers = {**self._form_headers, **accept}
+        if isinstance(self._session, requests.Session):
+            # Pin compression support so large JSON payloads travel packed,
+            # and ask HTTP/1.0-style servers to hold the socket open.
+            self._session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+            if keep_alive:
+                self._session.headers["Connection"] = "keep-alive"
+        self._url_cache: Dict[str, str] = {
+            name: f"{self.base_url}/{name}" for name in _DEVICE_ENDPOINTS
+        }
+        self._prepped: Dict[str, requests.PreparedRequest] = {}
+        self._prepped_puts: Dict[str, requests.PreparedRequest] = {}
+        if isinstance(self._session, requests.Session):
+            # Session.send() skips environment settings (proxies, CA
+            # bundles), so merge them once here and pass them with every
+            # prepared-request replay; otherwise prepped and regular calls
+            # diverge on proxy use and urllib3 pool keys.
+            self._send_kwargs = self._session.merge_environment_settings(
+                self.base_url, {}, None, None, None
+            )
+        else:
+            self._send_kwargs = None
+        self._cap_cache: Dict[Any, Any] = {}
+        self._ttls = dict(ttl_cache) if ttl_cache else None
+        self._ttl_cache: Dict[str, Any] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Any] = []
+        self._last_utc: Optional[str] = None
+        self._lock = threading.RLock() if lock else contextlib.nullcontext()
+
+    def invalidate_cache(self):
+        """Clear cached capability and metadata values, e.g. after reconnecting."""
+        self._cap_cache.clear()
+        self._ttl_cache.clear()
+
+    def invalidate(self, attribute: Optional[str] = None):
+        """Drop TTL-cached values so the next read hits the server.
+
+        Args:
+            attribute (str): Attribute to invalidate, or None for all.
+
+        """
+        if attribute is None:
+            self._ttl_cache.clear()
+        else:
+            self._ttl_cache.pop(attribute, None)
+
+    def enable_http_cache(self, cache_dir: str = ".alpaca_cache"):
+        """Mount an HTTP cache that honors the server's Cache-Control headers.
+
+        Servers that mark static endpoints cacheable then get their replies
+        served from a local file cache that survives across processes.
+        Requires the optional cachecontrol dependency (pip install
+        Alpyca[cache]) and the default requests session transport.
+
+        Args:
+            cache_dir (str): Directory to store cached responses in.
+
+        """
+        from cachecontrol import CacheControlAdapter
+        from cachecontrol.caches import FileCache
+
+        if not isinstance(self._session, requests.Session):
+            raise RuntimeError(
+                "HTTP caching requires the requests session transport"
+            )
+
+        # Mounting replaces the _AlpacaAdapter installed by _session_for,
+        # so the caching adapter must carry the same retry policy and
+        # socket options or every device on this server loses them.
+        class _CachingAlpacaAdapter(CacheControlAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["socket_options"] = _SOCKET_OPTIONS
+                super().init_poolmanager(*args, **kwargs)
+
+        prefix = self.base_url.split("://", 1)[0] + "://"
+        self._session.mount(
+            prefix,
+            _CachingAlpacaAdapter(
+                cache=FileCache(cache_dir),
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=_RETRIES,
+            ),
+        )
+
+    def close(self):
+        """Release this device's resources.
+
+        Sessions from the shared registry stay open for other devices on the
+        same server; use close_all_sessions() to tear those down.
+
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        """Enter context manager that closes the session on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit context manager and close the session."""
+        self.close()
 
     def action(self, Action: str, *Parameters):
         """Access functionality beyond the built-in capabilities of the ASCOM device interfaces.
@@ -60,7 +478,9 @@ class Device:
             *Parameters: List of required parameters or empty if none are required.
 
         """
-        return self._put("action", Action=Action, Parameters=Parameters)["Value"]
+        if Parameters:
+            return self._put("action", Action=Action, Parameters=Parameters)["Value"]
+        return self._put("action", Action=Action)["Value"]
 
     def commandblind(self, Command: str, Raw: bool):
         """Transmit an arbitrary string to the device and does not wait for a response.
@@ -84,7 +504,7 @@ class Device:
                 transmission.
 
         """
-        return self._put("commandbool", Command=Command, Raw=Raw)["Value"]
+        return bool(self._put("commandbool", Command=Command, Raw=Raw)["Value"])
 
     def commandstring(self, Command: str, Raw: bool):
         """Transmit an arbitrary string to the device and wait for a string response.
@@ -107,33 +527,127 @@ class Device:
                 Set None to get connected state (default).
         
         """
-        if Connected == None:
+        if Connected is None:
             return self._get("connected")
-        self._put("connected", Connected=Connected)
+        self._put_form("connected", _CONN_BODIES[bool(Connected)])
+        if not Connected:
+            # A reconnect may bring up a different driver or firmware;
+            # cached capabilities and metadata must not survive it.
+            self.invalidate_cache()
 
+    @_cached
     def description(self) -> str:
         """Get description of the device."""
-        return self._get("name")
+        return self._get("description")
 
-    def driverinfo(self) -> List[str]:
+    @_cached
+    def driverinfo(self) -> Tuple[str, ...]:
         """Get information of the device."""
-        return [i.strip() for i in self._get("driverinfo").split(",")]
+        return tuple(_DRIVERINFO_SPLIT(self._get("driverinfo").strip()))
 
+    @_cached
     def driverversion(self) -> str:
         """Get string containing only the major and minor version of the driver."""
         return self._get("driverversion")
 
+    @_cached
     def interfaceversion(self) -> int:
         """ASCOM Device interface version number that this device supports."""
         return self._get("interfaceversion")
 
+    @_cached
     def name(self) -> str:
         """Get name of the device."""
         return self._get("name")
 
-    def supportedactions(self) -> List[str]:
+    @_cached
+    def supportedactions(self) -> Tuple[str, ...]:
         """Get list of action names supported by this driver."""
-        return self._get("supportedactions")
+        return tuple(self._get("supportedactions"))
+
+    def multi_get(self, attributes: List[str]) -> Dict[str, Any]:
+        """Get several attributes concurrently over the pooled session.
+
+        Dispatches one GET per attribute on a thread pool so a status poll
+        like multi_get(["altitude", "azimuth", "slewing"]) completes in
+        roughly one round-trip instead of one per attribute.
+
+        Args:
+            attributes (List[str]): Attributes to get from server.
+
+        Returns:
+            Dict mapping each attribute name to its returned value.
+
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=8)
+        futures = {a: self._pool.submit(self._get, a) for a in attributes}
+        return {a: f.result() for a, f in futures.items()}
+
+    def _put_form_nowait(self, attribute: str, form: Union[str, bytes]):
+        """Dispatch a pre-encoded PUT on the thread pool without blocking.
+
+        Used by high-rate commands (pulseguide at guide-loop frequency)
+        where blocking on the HTTP round-trip caps the command rate.
+        Errors surface from flush().
+
+        Args:
+            attribute (str): Attribute to put to server.
+            form (str): Body already encoded as application/x-www-form-urlencoded.
+
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=8)
+        # Prune futures that already completed cleanly so a guide loop
+        # that never calls flush() cannot grow the list without bound;
+        # failed ones stay queued so flush() still raises them.
+        self._pending = [
+            f for f in self._pending if not f.done() or f.exception() is not None
+        ]
+        self._pending.append(self._pool.submit(self._put_form, attribute, form))
+
+    def flush(self):
+        """Wait for outstanding fire-and-forget commands and surface errors."""
+        while self._pending:
+            self._pending.pop().result()
+
+    def describe_all(self) -> Dict[str, Any]:
+        """Fetch all device metadata concurrently.
+
+        Collapses the six-request discovery walk done at startup
+        (description, driver info and version, interface version, name,
+        supported actions) into roughly one round-trip. Results land in
+        the same caches as the individual getters.
+
+        Returns:
+            Dict mapping each metadata method name to its returned value.
+
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=8)
+        names = (
+            "description",
+            "driverinfo",
+            "driverversion",
+            "interfaceversion",
+            "name",
+            "supportedactions",
+        )
+        futures = {n: self._pool.submit(getattr(self, n)) for n in names}
+        return {n: f.result() for n, f in futures.items()}
+
+    def _url(self, attribute: str) -> str:
+        """Build and cache the full URL for an Alpaca endpoint.
+
+        Args:
+            attribute (str): Attribute to build a URL for.
+
+        """
+        url = self._url_cache.get(attribute)
+        if url is None:
+            url = f"{self.base_url}/{attribute}"
+            self._url_cache[attribute] = url
+        return url
 
     def _get(self, attribute: str, **data):
         """Send an HTTP GET request to an Alpaca server and check response for errors.
@@ -141,11 +655,39 @@ class Device:
         Args:
             attribute (str): Attribute to get from server.
             **data: Data to send with request.
-        
+
         """
-        response = requests.get("%s/%s" % (self.base_url, attribute), data=data)
-        self.__check_error(response)
-        return response.json()["Value"]
+        ttl = self._ttls.get(attribute) if self._ttls and not data else None
+        if ttl is not None:
+            hit = self._ttl_cache.get(attribute)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+        if not data and isinstance(self._session, requests.Session):
+            # Hot polling loop: replay a prepared request instead of
+            # rebuilding headers and re-encoding the URL every call.
+            prepped = self._prepped.get(attribute)
+            if prepped is None:
+                prepped = self._session.prepare_request(
+                    requests.Request(
+                        "GET", self._url(attribute), headers=self._headers
+                    )
+                )
+                self._prepped[attribute] = prepped
+            response = self._session.send(prepped, **self._send_kwargs)
+        else:
+            response = self._session.get(
+                self._url(attribute), params=data or None, headers=self._headers
+            )
+        body = _decode(response)
+        n = body.get("ErrorNumber", 0)
+        if n:
+            raise NumericError(n, body.get("ErrorMessage", ""), response.status_code)
+        if response.status_code >= 400:
+            raise ErrorMessage(body.get("Value"), response.status_code)
+        value = _VALUE(body)
+        if ttl is not None:
+            self._ttl_cache[attribute] = (time.monotonic(), value)
+        return value
 
     def _put(self, attribute: str, **data):
         """Send an HTTP PUT request to an Alpaca server and check response for errors.
@@ -153,38 +695,108 @@ class Device:
         Args:
             attribute (str): Attribute to put to server.
             **data: Data to send with request.
-        
-        """
-        response = requests.put("%s/%s" % (self.base_url, attribute), data=data)
-        self.__check_error(response)
-        return response.json()
 
-    def __check_error(self, response: requests.Response):
-        """Check response from Alpaca server for Errors.
+        """
+        if self._ttls:
+            # Write-through invalidation: a set must not be masked by a
+            # stale cached read of the same attribute.
+            self._ttl_cache.pop(attribute, None)
+        if not data and isinstance(self._session, requests.Session):
+            # Command endpoints like park and abortslew carry no body;
+            # replay a prepared request instead of re-encoding headers.
+            prepped = self._prepped_puts.get(attribute)
+            if prepped is None:
+                prepped = self._session.prepare_request(
+                    requests.Request(
+                        "PUT", self._url(attribute), headers=self._headers
+                    )
+                )
+                self._prepped_puts[attribute] = prepped
+            with self._lock:
+                response = self._session.send(prepped, **self._send_kwargs)
+        else:
+            form = urlencode(data, doseq=True).encode("ascii") if data else None
+            headers = self._form_headers if form else self._headers
+            with self._lock:
+                if httpx is not None and isinstance(self._session, httpx.Client):
+                    # httpx deprecated data=<bytes>; raw bodies go in content=.
+                    response = self._session.put(
+                        self._url(attribute), content=form, headers=headers
+                    )
+                else:
+                    response = self._session.put(
+                        self._url(attribute), data=form, headers=headers
+                    )
+        body = _decode(response)
+        n = body.get("ErrorNumber", 0)
+        if n:
+            raise NumericError(n, body.get("ErrorMessage", ""), response.status_code)
+        if response.status_code >= 400:
+            raise ErrorMessage(body.get("Value"), response.status_code)
+        return body
+
+    def _put_form(self, attribute: str, form: Union[str, bytes]):
+        """Send an HTTP PUT request with a pre-encoded form body.
+
+        Skips the generic dict-to-form encoding inside the HTTP library, so
+        high-rate commands like pulseguide and moveaxis can build their body
+        with one f-string.
 
         Args:
-            response (Response): Response from Alpaca server to check.
-
-        """
-        j = response.json()
-        if j["ErrorNumber"] != 0:
-            raise NumericError(j["ErrorNumber"], j["ErrorMessage"])
-        elif response.status_code == 400 or response.status_code == 500:
-            raise ErrorMessage(j["Value"])
+            attribute (str): Attribute to put to server.
+            form (str): Body already encoded as application/x-www-form-urlencoded,
+                as text or bytes.
+
+        """
+        if self._ttls:
+            self._ttl_cache.pop(attribute, None)
+        with self._lock:
+            if httpx is not None and isinstance(self._session, httpx.Client):
+                # httpx deprecated data=<bytes/str>; raw bodies go in content=.
+                response = self._session.put(
+                    self._url(attribute), content=form, headers=self._form_headers
+                )
+            else:
+                response = self._session.put(
+                    self._url(attribute), data=form, headers=self._form_headers
+                )
+        body = _decode(response)
+        n = body.get("ErrorNumber", 0)
+        if n:
+            raise NumericError(n, body.get("ErrorMessage", ""), response.status_code)
+        if response.status_code >= 400:
+            raise ErrorMessage(body.get("Value"), response.status_code)
+        return body
 
 
 class Switch(Device):
     """Switch specific methods."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: str,
         device_number: int,
         protocall: str = "http",
         api_version: int = DEFAULT_API_VERSION,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize Switch object."""
-        super().__init__(address, "switch", device_number, protocall, api_version)
+        super().__init__(
+            address,
+            "switch",
+            device_number,
+            protocall,
+            api_version,
+            keep_alive,
+            ttl_cache,
+            session,
+            lock,
+        )
 
     def maxswitch(self) -> int:
         """Count of switch devices managed by this driver.
@@ -345,20 +957,62 @@ class Switch(Device):
         """
         return self._get("switchstep", Id=Id)
 
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Read the full state of every switch concurrently.
+
+        Fires getswitch, getswitchvalue, getswitchname and
+        getswitchdescription for all devices on the thread pool, so the
+        whole panel refreshes in roughly one round-trip instead of
+        4 x maxswitch.
+
+        Returns:
+            List with one dict per switch device holding its state, value,
+            name and description.
+
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=8)
+        count = self.maxswitch()
+        attributes = ("getswitch", "getswitchvalue", "getswitchname",
+                      "getswitchdescription")
+        futures = [
+            {a: self._pool.submit(self._get, a, Id=i) for a in attributes}
+            for i in range(count)
+        ]
+        keys = ("state", "value", "name", "description")
+        return [
+            {k: futs[a].result() for k, a in zip(keys, attributes)}
+            for futs in futures
+        ]
+
 
 class SafetyMonitor(Device):
     """Safety monitor specific methods."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: str,
         device_number: int,
         protocall: str = "http",
         api_version: int = DEFAULT_API_VERSION,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize SafetyMonitor object."""
         super().__init__(
-            address, "safetymonitor", device_number, protocall, api_version
+            address,
+            "safetymonitor",
+            device_number,
+            protocall,
+            api_version,
+            keep_alive,
+            ttl_cache,
+            session,
+            lock,
         )
 
     def issafe(self) -> bool:
@@ -374,15 +1028,31 @@ class SafetyMonitor(Device):
 class Dome(Device):
     """Dome specific methods."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: str,
         device_number: int,
         protocall: str = "http",
         api_version: int = DEFAULT_API_VERSION,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize Dome object."""
-        super().__init__(address, "dome", device_number, protocall, api_version)
+        super().__init__(
+            address,
+            "dome",
+            device_number,
+            protocall,
+            api_version,
+            keep_alive,
+            ttl_cache,
+            session,
+            lock,
+        )
 
     def altitude(self) -> float:
         """Dome altitude.
@@ -432,6 +1102,7 @@ class Dome(Device):
         """
         return self._get("azimuth")
 
+    @_cached
     def canfindhome(self) -> bool:
         """Indicate whether the dome can find the home position.
 
@@ -441,6 +1112,7 @@ class Dome(Device):
         """
         return self._get("canfindhome")
 
+    @_cached
     def canpark(self) -> bool:
         """Indicate whether the dome can be parked.
 
@@ -450,6 +1122,7 @@ class Dome(Device):
         """
         return self._get("canpark")
 
+    @_cached
     def cansetaltitude(self) -> bool:
         """Indicate whether the dome altitude can be set.
 
@@ -459,6 +1132,7 @@ class Dome(Device):
         """
         return self._get("cansetaltitude")
 
+    @_cached
     def cansetazimuth(self) -> bool:
         """Indicate whether the dome azimuth can be set.
 
@@ -468,6 +1142,7 @@ class Dome(Device):
         """
         return self._get("cansetazimuth")
 
+    @_cached
     def cansetpark(self) -> bool:
         """Indicate whether the dome park position can be set.
 
@@ -477,6 +1152,7 @@ class Dome(Device):
         """
         return self._get("cansetpark")
 
+    @_cached
     def cansetshutter(self) -> bool:
         """Indicate whether the dome shutter can be opened.
 
@@ -486,6 +1162,7 @@ class Dome(Device):
         """
         return self._get("cansetshutter")
 
+    @_cached
     def canslave(self) -> bool:
         """Indicate whether the dome supports slaving to a telescope.
 
@@ -495,6 +1172,7 @@ class Dome(Device):
         """
         return self._get("canslave")
 
+    @_cached
     def cansyncazimuth(self) -> bool:
         """Indicate whether the dome azimuth position can be synched.
 
@@ -527,7 +1205,7 @@ class Dome(Device):
             True or False value in not set.
         
         """
-        if Slaved == None:
+        if Slaved is None:
             return self._get("slaved")
         self._put("slaved", Slaved=Slaved)
 
@@ -613,15 +1291,31 @@ class Dome(Device):
 class Camera(Device):
     """Camera specific methods."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: str,
         device_number: int,
         protocall: str = "http",
         api_version: int = DEFAULT_API_VERSION,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize Camera object."""
-        super().__init__(address, "camera", device_number, protocall, api_version)
+        super().__init__(
+            address,
+            "camera",
+            device_number,
+            protocall,
+            api_version,
+            keep_alive,
+            ttl_cache,
+            session,
+            lock,
+        )
 
     def bayeroffsetx(self) -> int:
         """Return the X offset of the Bayer matrix, as defined in SensorType."""
@@ -641,7 +1335,7 @@ class Camera(Device):
             Binning factor for the X axis.
         
         """
-        if BinX == None:
+        if BinX is None:
             return self._get("binx")
         self._put("binx", BinX=BinX)
 
@@ -655,7 +1349,7 @@ class Camera(Device):
             Binning factor for the Y axis.
         
         """
-        if BinY == None:
+        if BinY is None:
             return self._get("biny")
         self._put("biny", BinY=BinY)
 
@@ -680,30 +1374,37 @@ class Camera(Device):
         """Return the height of the CCD camera chip."""
         return self._get("cameraysize")
 
+    @_cached
     def canabortexposure(self) -> bool:
         """Indicate whether the camera can abort exposures."""
         return self._get("canabortexposure")
 
+    @_cached
     def canasymmetricbin(self) -> bool:
         """Indicate whether the camera supports asymmetric binning."""
         return self._get("canasymmetricbin")
 
+    @_cached
     def canfastreadout(self) -> bool:
         """Indicate whether the camera has a fast readout mode."""
         return self._get("canfastreadout")
 
+    @_cached
     def cangetcoolerpower(self) -> bool:
         """Indicate whether the camera's cooler power setting can be read."""
         return self._get("cangetcoolerpower")
 
+    @_cached
     def canpulseguide(self) -> bool:
         """Indicate whether this camera supports pulse guiding."""
         return self._get("canpulseguide")
 
+    @_cached
     def cansetccdtemperature(self) -> bool:
         """Indicate whether this camera supports setting the CCD temperature."""
         return self._get("cansetccdtemperature")
 
+    @_cached
     def canstopexposure(self) -> bool:
         """Indicate whether this camera can stop an exposure that is in progress."""
         return self._get("canstopexposure")
@@ -725,7 +1426,7 @@ class Camera(Device):
             Current cooler on/off state.
         
         """
-        if CoolerOn == None:
+        if CoolerOn is None:
             return self._get("cooleron")
         self._put("cooleron", CoolerOn=CoolerOn)
 
@@ -759,7 +1460,7 @@ class Camera(Device):
             Whether Fast Readout Mode is enabled.
 
         """
-        if FastReadout == None:
+        if FastReadout is None:
             return self._get("fastreadout")
         self._put("fastreadout", FastReadout=FastReadout)
 
@@ -785,7 +1486,7 @@ class Camera(Device):
             Index into the Gains array for the selected camera gain.
         
         """
-        if Gain == None:
+        if Gain is None:
             return self._get("gain")
         self._put("gain", Gain=Gain)
 
@@ -836,8 +1537,15 @@ class Camera(Device):
         Returns:
             Array of integers containing the exposure pixel values.
         
+        When numpy is installed the pixel values are returned as a 32bit
+        integer ndarray, which skips building millions of Python int
+        objects; otherwise the nested lists are returned as-is.
+
         """
-        return self._get("imagearray")
+        value = self._get("imagearray")
+        if numpy is not None:
+            return numpy.asarray(value, dtype=numpy.int32)
+        return value
 
     def imagearrayvariant(self) -> List[int]:
         r"""Return an array of integers containing the exposure pixel values.
@@ -860,8 +1568,15 @@ class Camera(Device):
         Returns:
             Array of integers containing the exposure pixel values.
         
+        When numpy is installed the pixel values are returned as a 32bit
+        integer ndarray, which skips building millions of Python int
+        objects; otherwise the nested lists are returned as-is.
+
         """
-        return self._get("imagearrayvariant")
+        value = self._get("imagearrayvariant")
+        if numpy is not None:
+            return numpy.asarray(value, dtype=numpy.int32)
+        return value
 
     def imageready(self) -> bool:
         """Indicate that an image is ready to be downloaded."""
@@ -910,7 +1625,7 @@ class Camera(Device):
             Current subframe width.
         
         """
-        if NumX == None:
+        if NumX is None:
             return self._get("numx")
         self._put("numx", NumX=NumX)
 
@@ -925,7 +1640,7 @@ class Camera(Device):
             Current subframe height.
         
         """
-        if NumY == None:
+        if NumY is None:
             return self._get("numy")
         self._put("numy", NumY=NumY)
 
@@ -950,7 +1665,7 @@ class Camera(Device):
 
     def readoutmode(self, ReadoutMode: Optional[int] = None) -> int:
         """Indicate the canera's readout mode as an index into the array ReadoutModes."""
-        if ReadoutMode == None:
+        if ReadoutMode is None:
             return self._get("readoutmode")
         self._put("readoutmode", ReadoutMode=ReadoutMode)
 
@@ -987,7 +1702,7 @@ class Camera(Device):
             Camera's cooler setpoint (degrees Celsius).
         
         """
-        if SetCCDTemperature == None:
+        if SetCCDTemperature is None:
             return self._get("setccdtemperature")
         self._put("setccdtemperature", SetCCDTemperature=SetCCDTemperature)
 
@@ -1002,7 +1717,7 @@ class Camera(Device):
             current value. If binning is active, value is in binned pixels.
         
         """
-        if StartX == None:
+        if StartX is None:
             return self._get("startx")
         self._put("startx", StartX=StartX)
 
@@ -1017,7 +1732,7 @@ class Camera(Device):
             current value. If binning is active, value is in binned pixels.
         
         """
-        if StartY == None:
+        if StartY is None:
             return self._get("starty")
         self._put("starty", StartY=StartY)
 
@@ -1025,16 +1740,25 @@ class Camera(Device):
         """Abort the current exposure, if any, and returns the camera to Idle state."""
         self._put("abortexposure")
 
-    def pulseguide(self, Direction: int, Duration: int):
+    def pulseguide(self, Direction: int, Duration: int, wait: bool = True):
         """Pulse guide in the specified direction for the specified time.
         
         Args:
             Direction (int): Direction of movement (0 = North, 1 = South, 2 = East,
                 3 = West).
             Duration (int): Duration of movement in milli-seconds.
+            wait (bool): Set False to return without blocking on the HTTP
+                round-trip; call flush() to collect errors.
         
         """
-        self._put("pulseguide", Direction=Direction, Duration=Duration)
+        form = (
+            f"Direction={quote_plus(str(Direction))}"
+            f"&Duration={quote_plus(str(Duration))}"
+        )
+        if wait:
+            self._put_form("pulseguide", form)
+        else:
+            self._put_form_nowait("pulseguide", form)
 
     def startexposure(self, Duration: float, Light: bool):
         """Start an exposure.
@@ -1063,33 +1787,49 @@ class Camera(Device):
 class FilterWheel(Device):
     """Filter wheel specific methods."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: str,
         device_number: int,
         protocall: str = "http",
         api_version: int = DEFAULT_API_VERSION,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize FilterWheel object."""
-        super().__init__(address, "filterwheel", device_number, protocall, api_version)
+        super().__init__(
+            address,
+            "filterwheel",
+            device_number,
+            protocall,
+            api_version,
+            keep_alive,
+            ttl_cache,
+            session,
+            lock,
+        )
 
-    def focusoffsets(self) -> List[int]:
+    def focusoffsets(self) -> Tuple[int, ...]:
         """Filter focus offsets.
 
         Returns:
             An integer array of filter focus offsets.
         
         """
-        return self._get("focusoffsets")
+        return tuple(self._get("focusoffsets"))
 
-    def names(self) -> List[str]:
+    def names(self) -> Tuple[str, ...]:
         """Filter wheel filter names.
 
         Returns:
             Names of the filters.
 
         """
-        return self._get("names")
+        return tuple(self._get("names"))
 
     def position(self, Position: Optional[int] = None):
         """Set or return the filter wheel position.
@@ -1101,7 +1841,7 @@ class FilterWheel(Device):
             Returns the current filter wheel position.
         
         """
-        if Position == None:
+        if Position is None:
             return self._get("position")
         self._put("position", Position=Position)
 
@@ -1109,17 +1849,34 @@ class FilterWheel(Device):
 class Telescope(Device):
     """Telescope specific methods."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: str,
         device_number: int,
         protocall: str = "http",
         api_version: int = DEFAULT_API_VERSION,
+        keep_alive: bool = True,
+        ttl_cache: Optional[Mapping[str, float]] = None,
+        session: Optional[requests.Session] = None,
+        lock: bool = True,
     ):
         """Initialize Telescope object."""
-        super().__init__(address, "telescope", device_number, protocall, api_version)
+        super().__init__(
+            address,
+            "telescope",
+            device_number,
+            protocall,
+            api_version,
+            keep_alive,
+            ttl_cache,
+            session,
+            lock,
+        )
 
-    def alignmentmode(self):
+    @_cached
+    def alignmentmode(self) -> int:
         """Return the current mount alignment mode.
 
         Returns:
@@ -1128,7 +1885,7 @@ class Telescope(Device):
         """
         return self._get("alignmentmode")
 
-    def altitude(self):
+    def altitude(self) -> float:
         """Return the mount's Altitude above the horizon.
 
         Returns:
@@ -1137,7 +1894,8 @@ class Telescope(Device):
         """
         return self._get("altitude")
 
-    def aperturearea(self):
+    @_cached
+    def aperturearea(self) -> float:
         """Return the telescope's aperture.
 
         Returns:
@@ -1146,7 +1904,8 @@ class Telescope(Device):
         """
         return self._get("aperturearea")
 
-    def aperturediameter(self):
+    @_cached
+    def aperturediameter(self) -> float:
         """Return the telescope's effective aperture.
 
         Returns:
@@ -1155,7 +1914,7 @@ class Telescope(Device):
         """
         return self._get("aperturediameter")
 
-    def athome(self):
+    def athome(self) -> bool:
         """Indicate whether the mount is at the home position.
 
         Returns:
@@ -1165,7 +1924,7 @@ class Telescope(Device):
         """
         return self._get("athome")
 
-    def atpark(self):
+    def atpark(self) -> bool:
         """Indicate whether the telescope is at the park position.
 
         Returns:
@@ -1175,7 +1934,7 @@ class Telescope(Device):
         """
         return self._get("atpark")
 
-    def azimuth(self):
+    def azimuth(self) -> float:
         """Return the telescope's aperture.
         
         Return:
@@ -1185,145 +1944,101 @@ class Telescope(Device):
         """
         return self._get("azimuth")
 
-    def canfindhome(self):
-        """Indicate whether the mount can find the home position.
-        
-        Returns:
-            True if this telescope is capable of programmed finding its home position.
-        
-        """
-        return self._get("canfindhome")
-
-    def canpark(self):
-        """Indicate whether the telescope can be parked.
-
-        Returns:
-            True if this telescope is capable of programmed parking.
-        
-        """
-        return self._get("canpark")
-
-    def canpulseguide(self):
-        """Indicate whether the telescope can be pulse guided.
-
-        Returns:
-            True if this telescope is capable of software-pulsed guiding (via the
-            pulseguide(int, int) method).
-        
-        """
-        return self._get("canpulseguide")
-
-    def cansetdeclinationrate(self):
-        """Indicate whether the DeclinationRate property can be changed.
-
-        Returns:
-            True if the DeclinationRate property can be changed to provide offset
-            tracking in the declination axis.
-
-        """
-        return self._get("cansetdeclinationrate")
-
-    def cansetguiderates(self):
-        """Indicate whether the DeclinationRate property can be changed.
-
-        Returns:
-            True if the guide rate properties used for pulseguide(int, int) can ba
-            adjusted.
-
-        """
-        return self._get("cansetguiderates")
-
-    def cansetpark(self):
-        """Indicate whether the telescope park position can be set.
-
-        Returns:
-            True if this telescope is capable of programmed setting of its park position
-            (setpark() method).
-
-        """
-        return self._get("cansetpark")
-
-    def cansetpierside(self):
-        """Indicate whether the telescope SideOfPier can be set.
-
-        Returns:
-            True if the SideOfPier property can be set, meaning that the mount can be
-            forced to flip.
-        
-        """
-        return self._get("cansetpierside")
-
-    def cansetrightascensionrate(self):
-        """Indicate whether the RightAscensionRate property can be changed.
-
-        Returns:
-            True if the RightAscensionRate property can be changed to provide offset
-            tracking in the right ascension axis.
-        
-        """
-        return self._get("cansetrightascensionrate")
-
-    def cansettracking(self):
-        """Indicate whether the Tracking property can be changed.
-
-        Returns:
-            True if the Tracking property can be changed, turning telescope sidereal
-            tracking on and off.
-        
-        """
-        return self._get("cansettracking")
-
-    def canslew(self):
-        """Indicate whether the telescope can slew synchronously.
-
-        Returns:
-            True if this telescope is capable of programmed slewing (synchronous or
-            asynchronous) to equatorial coordinates.
-        
-        """
-        return self._get("canslew")
-
-    def canslewaltaz(self):
-        """Indicate whether the telescope can slew synchronously to AltAz coordinates.
-
-        Returns:
-            True if this telescope is capable of programmed slewing (synchronous or
-            asynchronous) to local horizontal coordinates.
-
-        """
-        return self._get("canslewaltaz")
-
-    def canslewaltazasync(self):
-        """Indicate whether the telescope can slew asynchronusly to AltAz coordinates.
-
-        Returns:
-            True if this telescope is capable of programmed asynchronus slewing
-            (synchronous or asynchronous) to local horizontal coordinates.
-
-        """
-        return self._get("canslewaltazasync")
-
-    def cansync(self):
-        """Indicate whether the telescope can sync to equatorial coordinates.
-
-        Returns:
-            True if this telescope is capable of programmed synching to equatorial
-            coordinates.
-        
-        """
-        return self._get("cansync")
-
-    def cansyncaltaz(self):
-        """Indicate whether the telescope can sync to local horizontal coordinates.
-
-        Returns:
-            True if this telescope is capable of programmed synching to local horizontal
-            coordinates.
-        
-        """
-        return self._get("cansyncaltaz")
-
-    def declination(self):
+    # Capability queries are fixed for the life of a device session, so
+    # these thin cached getters are generated below from this spec table
+    # of (attribute, summary, returns) rather than repeated by hand.
+    _CAPABILITIES = (
+        (
+            "canfindhome",
+            "Indicate whether the mount can find the home position.",
+            "True if this telescope is capable of programmed finding its home "
+            "position.",
+        ),
+        (
+            "canpark",
+            "Indicate whether the telescope can be parked.",
+            "True if this telescope is capable of programmed parking.",
+        ),
+        (
+            "canpulseguide",
+            "Indicate whether the telescope can be pulse guided.",
+            "True if this telescope is capable of software-pulsed guiding (via "
+            "the pulseguide(int, int) method).",
+        ),
+        (
+            "cansetdeclinationrate",
+            "Indicate whether the DeclinationRate property can be changed.",
+            "True if the DeclinationRate property can be changed to provide "
+            "offset tracking in the declination axis.",
+        ),
+        (
+            "cansetguiderates",
+            "Indicate whether the guide rate properties can be adjusted.",
+            "True if the guide rate properties used for pulseguide(int, int) "
+            "can ba adjusted.",
+        ),
+        (
+            "cansetpark",
+            "Indicate whether the telescope park position can be set.",
+            "True if this telescope is capable of programmed setting of its "
+            "park position (setpark() method).",
+        ),
+        (
+            "cansetpierside",
+            "Indicate whether the telescope SideOfPier can be set.",
+            "True if the SideOfPier property can be set, meaning that the "
+            "mount can be forced to flip.",
+        ),
+        (
+            "cansetrightascensionrate",
+            "Indicate whether the RightAscensionRate property can be changed.",
+            "True if the RightAscensionRate property can be changed to "
+            "provide offset tracking in the right ascension axis.",
+        ),
+        (
+            "cansettracking",
+            "Indicate whether the Tracking property can be changed.",
+            "True if the Tracking property can be changed, turning telescope "
+            "sidereal tracking on and off.",
+        ),
+        (
+            "canslew",
+            "Indicate whether the telescope can slew synchronously.",
+            "True if this telescope is capable of programmed slewing "
+            "(synchronous or asynchronous) to equatorial coordinates.",
+        ),
+        (
+            "canslewaltaz",
+            "Indicate whether the telescope can slew synchronously to AltAz "
+            "coordinates.",
+            "True if this telescope is capable of programmed slewing "
+            "(synchronous or asynchronous) to local horizontal coordinates.",
+        ),
+        (
+            "canslewaltazasync",
+            "Indicate whether the telescope can slew asynchronusly to AltAz "
+            "coordinates.",
+            "True if this telescope is capable of programmed asynchronus "
+            "slewing (synchronous or asynchronous) to local horizontal "
+            "coordinates.",
+        ),
+        (
+            "cansync",
+            "Indicate whether the telescope can sync to equatorial "
+            "coordinates.",
+            "True if this telescope is capable of programmed synching to "
+            "equatorial coordinates.",
+        ),
+        (
+            "cansyncaltaz",
+            "Indicate whether the telescope can sync to local horizontal "
+            "coordinates.",
+            "True if this telescope is capable of programmed synching to "
+            "local horizontal coordinates.",
+        ),
+    )
+
+    def declination(self) -> float:
         """Return the telescope's declination.
 
         Notes:
@@ -1347,7 +2062,7 @@ class Telescope(Device):
             not set.
         
         """
-        if DeclinationRate == None:
+        if DeclinationRate is None:
             return self._get("declinationrate")
         self._put("declinationrate", DeclinationRate=DeclinationRate)
 
@@ -1363,11 +2078,12 @@ class Telescope(Device):
             coordinates.
 
         """
-        if DoesRefraction == None:
+        if DoesRefraction is None:
             return self._get("doesrefraction")
         self._put("doesrefraction", DoesRefraction=DoesRefraction)
 
-    def equatorialsystem(self):
+    @_cached
+    def equatorialsystem(self) -> int:
         """Return the current equatorial coordinate system used by this telescope.
 
         Returns:
@@ -1377,7 +2093,8 @@ class Telescope(Device):
         """
         return self._get("equatorialsystem")
 
-    def focallength(self):
+    @_cached
+    def focallength(self) -> float:
         """Return the telescope's focal length in meters.
 
         Returns:
@@ -1397,7 +2114,7 @@ class Telescope(Device):
             Current declination rate offset for telescope guiding if not set.
 
         """
-        if GuideRateDeclination == None:
+        if GuideRateDeclination is None:
             return self._get("guideratedeclination")
         self._put("guideratedeclination", GuideRateDeclination=GuideRateDeclination)
 
@@ -1412,13 +2129,13 @@ class Telescope(Device):
             Current right ascension rate offset for telescope guiding if not set.
 
         """
-        if GuideRateRightAscension == None:
+        if GuideRateRightAscension is None:
             return self._get("guideraterightascension")
         self._put(
             "guideraterightascension", GuideRateRightAscension=GuideRateRightAscension
         )
 
-    def ispulseguiding(self):
+    def ispulseguiding(self) -> bool:
         """Indicate whether the telescope is currently executing a PulseGuide command.
 
         Returns:
@@ -1427,7 +2144,7 @@ class Telescope(Device):
         """
         return self._get("ispulseguiding")
 
-    def rightascension(self):
+    def rightascension(self) -> float:
         """Return the telescope's right ascension coordinate.
 
         Returns:
@@ -1449,7 +2166,7 @@ class Telescope(Device):
             Telescope's right ascension tracking rate if not set.
 
         """
-        if RightAscensionRate == None:
+        if RightAscensionRate is None:
             return self._get("rightascensionrate")
         self._put("rightascensionrate", RightAscensionRate=RightAscensionRate)
 
@@ -1463,11 +2180,11 @@ class Telescope(Device):
             Side of pier if not set.
         
         """
-        if SideOfPier == None:
+        if SideOfPier is None:
             return self._get("sideofpier")
         self._put("sideofpier", SideOfPier=SideOfPier)
 
-    def siderealtime(self):
+    def siderealtime(self) -> float:
         """Return the local apparent sidereal time.
 
         Returns:
@@ -1488,7 +2205,7 @@ class Telescope(Device):
             is located if not set.
 
         """
-        if SiteElevation == None:
+        if SiteElevation is None:
             return self._get("siteelevation")
         self._put("siteelevation", SiteElevation=SiteElevation)
 
@@ -1503,7 +2220,7 @@ class Telescope(Device):
             the telescope is located if not set.
         
         """
-        if SiteLatitude == None:
+        if SiteLatitude is None:
             return self._get("sitelatitude")
         self._put("sitelatitude", SiteLatitude=SiteLatitude)
 
@@ -1518,11 +2235,11 @@ class Telescope(Device):
             is located.
         
         """
-        if SiteLongitude == None:
+        if SiteLongitude is None:
             return self._get("sitelongitude")
         self._put("sitelongitude", SiteLongitude=SiteLongitude)
 
-    def slewing(self):
+    def slewing(self) -> bool:
         """Indicate whether the telescope is currently slewing.
 
         Returns:
@@ -1542,10 +2259,28 @@ class Telescope(Device):
             Returns the post-slew settling time (sec.) if not set.
 
         """
-        if SlewSettleTime == None:
+        if SlewSettleTime is None:
             return self._get("slewsettletime")
         self._put("slewsettletime", SlewSettleTime=SlewSettleTime)
 
+    def wait_for_slew_complete(self, poll_ms: int = 200):
+        """Block until an in-progress slew finishes and settles.
+
+        Fetches slewsettletime once up front (it cannot change mid-slew),
+        then polls slewing() until the mount stops and sleeps out the
+        settle period, halving the per-iteration round-trips of the usual
+        hand-rolled wait loop.
+
+        Args:
+            poll_ms (int): Delay between slewing() polls in milliseconds.
+
+        """
+        settle = self.slewsettletime()
+        while self.slewing():
+            time.sleep(poll_ms / 1000)
+        if settle:
+            time.sleep(settle)
+
     def targetdeclination(self, TargetDeclination: Optional[float] = None):
         """Set or return the target declination of a slew or sync.
 
@@ -1557,7 +2292,7 @@ class Telescope(Device):
             or sync operation.
         
         """
-        if TargetDeclination == None:
+        if TargetDeclination is None:
             return self._get("targetdeclination")
         self._put("targetdeclination", TargetDeclination=TargetDeclination)
 
@@ -1572,7 +2307,7 @@ class Telescope(Device):
             operation.
 
         """
-        if TargetRightAscension == None:
+        if TargetRightAscension is None:
             return self._get("targetrightascension")
         self._put("targetrightascension", TargetRightAscension=TargetRightAscension)
 
@@ -1586,7 +2321,7 @@ class Telescope(Device):
             State of the telescope's sidereal tracking drive.
         
         """
-        if Tracking == None:
+        if Tracking is None:
             return self._get("tracking")
         self._put("tracking", Tracking=Tracking)
 
@@ -1601,11 +2336,12 @@ class Telescope(Device):
             Current tracking rate of the telescope's sidereal drive if not set.
         
         """
-        if TrackingRate == None:
+        if TrackingRate is None:
             return self._get("trackingrate")
         self._put("trackingrate", TrackingRate=TrackingRate)
 
-    def trackingrates(self):
+    @_cached
+    def trackingrates(self) -> List[int]:
         """Return a collection of supported DriveRates values.
 
         Returns:
@@ -1625,22 +2361,33 @@ class Telescope(Device):
             datetime of the UTC date/time if not set.
         
         """
-        if UTCDate == None:
-            return dateutil.parser.parse(self._get("utcdate"))
-
-        if type(UTCDate) is str:
-            data = UTCDate
-        elif type(UTCDate) is datetime:
-            data = UTCDate.isoformat()
-        else:
-            raise TypeError()
+        if UTCDate is None:
+            return _parse_iso(self._get("utcdate"))
+
+        try:
+            data = _UTC_ENCODERS[type(UTCDate)](UTCDate)
+        except KeyError:
+            # Exact-type dispatch misses subclasses (e.g. pandas.Timestamp),
+            # so fall back to the isinstance checks before rejecting.
+            if isinstance(UTCDate, str):
+                data = UTCDate
+            elif isinstance(UTCDate, datetime):
+                data = UTCDate.isoformat()
+            else:
+                raise TypeError() from None
+        if data == self._last_utc:
+            # Schedulers often re-send the value already on the mount's
+            # clock; skip the no-op round-trip.
+            return
 
         self._put("utcdate", UTCDate=data)
+        self._last_utc = data
 
     def abortslew(self):
         """Immediatley stops a slew in progress."""
         self._put("abortslew")
 
+    @_cached
     def axisrates(self, Axis: int):
         """Return rates at which the telescope may be moved about the specified axis.
 
@@ -1651,6 +2398,7 @@ class Telescope(Device):
         """
         return self._get("axisrates", Axis=Axis)
 
+    @_cached
     def canmoveaxis(self, Axis: int):
         """Indicate whether the telescope can move the requested axis.
 
@@ -1660,6 +2408,7 @@ class Telescope(Device):
         """
         return self._get("canmoveaxis", Axis=Axis)
 
+    @_cached
     def destinationsideofpier(self, RightAscension: float, Declination: float):
         """Predict the pointing state after a German equatorial mount slews to given coordinates.
 
@@ -1684,22 +2433,28 @@ class Telescope(Device):
         """Move the mount to the "home" position."""
         self._put("findhome")
 
-    def moveaxis(self, Axis: int, Rate: float):
+    def moveaxis(self, Axis: int, Rate: float, wait: bool = True):
         """Move a telescope axis at the given rate.
 
         Args:
             Axis (int): The axis about which rate information is desired.
                 0 = axisPrimary, 1 = axisSecondary, 2 = axisTertiary.
             Rate (float): The rate of motion (deg/sec) about the specified axis
+            wait (bool): Set False to return without blocking on the HTTP
+                round-trip; call flush() to collect errors.
 
         """
-        self._put("moveaxis", Axis=Axis, Rate=Rate)
+        form = f"Axis={quote_plus(str(Axis))}&Rate={quote_plus(str(Rate))}"
+        if wait:
+            self._put_form("moveaxis", form)
+        else:
+            self._put_form_nowait("moveaxis", form)
 
     def park(self):
         """Park the mount."""
         self._put("park")
 
-    def pulseguide(self, Direction: int, Duration: int):
+    def pulseguide(self, Direction: int, Duration: int, wait: bool = True):
         """Move the scope in the given direction for the given time.
 
         Notes:
@@ -1708,9 +2463,19 @@ class Telescope(Device):
         Args:
             Direction (int): Direction in which the guide-rate motion is to be made.
             Duration (int): Duration of the guide-rate motion (milliseconds).
+            wait (bool): Set False to return without blocking on the HTTP
+                round-trip, keeping autoguider loops mount-bound rather than
+                RTT-bound; call flush() to collect errors.
         
         """
-        self._put("pulseguide", Direction=Direction, Duration=Duration)
+        form = (
+            f"Direction={quote_plus(str(Direction))}"
+            f"&Duration={quote_plus(str(Duration))}"
+        )
+        if wait:
+            self._put_form("pulseguide", form)
+        else:
+            self._put_form_nowait("pulseguide", form)
 
     def setpark(self):
         """Set the telescope's park position."""
@@ -1804,36 +2569,87 @@ class Telescope(Device):
         self._put("unpark")
 
 
-class NumericError(Exception):
+
+for _spec in Telescope._CAPABILITIES:
+    setattr(Telescope, _spec[0], _capability_getter(*_spec))
+del _spec
+
+
+class AlpacaError(Exception):
+    """Base exception for errors reported by an Alpaca server.
+
+    Callers can catch this to handle any Alpaca failure and inspect the
+    attributes to discriminate device errors from plain HTTP failures,
+    e.g. for retry logic.
+
+    Attributes:
+        error_number (int): Alpaca error number, or -1 when the server did
+            not supply one.
+        status_code (int): HTTP status code of the response, or None if not
+            known.
+
+    """
+
+    __slots__ = ("error_number", "status_code")
+
+    def __init__(
+        self,
+        ErrorNumber: int,
+        ErrorMessage: str,
+        StatusCode: Optional[int] = None,
+    ):
+        """Initialize AlpacaError object."""
+        super().__init__(ErrorMessage)
+        self.error_number = ErrorNumber
+        self.status_code = StatusCode
+
+
+class NumericError(AlpacaError):
     """Exception for when Alpaca throws an error with a numeric value.
-    
+
     Args:
         ErrorNumber (int): Non-zero integer.
         ErrorMessage (str): Message describing the issue that was encountered.
-    
+        StatusCode (int): HTTP status code of the response, if known.
+
     """
 
-    def __init__(self, ErrorNumber: int, ErrorMessage: str):
+    __slots__ = ("error_message",)
+
+    def __init__(
+        self,
+        ErrorNumber: int,
+        ErrorMessage: str,
+        StatusCode: Optional[int] = None,
+    ):
         """Initialize NumericError object."""
-        super().__init__(self)
-        self.message = "Error %d: %s" % (ErrorNumber, ErrorMessage)
+        super().__init__(ErrorNumber, ErrorMessage, StatusCode)
+        self.error_message = ErrorMessage
+
+    @property
+    def message(self) -> str:
+        """Formatted message to display with error."""
+        return f"Error {self.error_number}: {self.error_message}"
 
     def __str__(self):
         """Message to display with error."""
         return self.message
 
 
-class ErrorMessage(Exception):
+class ErrorMessage(AlpacaError):
     """Exception for when Alpaca throws an error without a numeric value.
-    
+
     Args:
         Value (str): Message describing the issue that was encountered.
-    
+        StatusCode (int): HTTP status code of the response, if known.
+
     """
 
-    def __init__(self, Value: str):
+    __slots__ = ()
+
+    def __init__(self, Value: str, StatusCode: Optional[int] = None):
         """Initialize ErrorMessage object."""
-        super().__init__(self)
+        super().__init__(-1, Value, StatusCode)
         self.message = Value
 
     def __str__(self):
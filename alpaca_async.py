@@ -0,0 +1,499 @@
+"""Asynchronous variant of the Alpaca wrappers built on aiohttp.
+
+Mirrors the classes in alpaca.py with coroutine methods so many Alpaca
+calls can be awaited concurrently, e.g.::
+
+    async with AsyncTelescope("127.0.0.1:11111", 0) as t:
+        alt, az, ra = await asyncio.gather(
+            t.altitude(), t.azimuth(), t.rightascension()
+        )
+
+Requires the optional aiohttp dependency (pip install Alpyca[async]).
+
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional, Union, List, Dict, Mapping, Any
+import aiohttp
+
+from alpaca import DEFAULT_API_VERSION, NumericError, ErrorMessage, _parse_iso
+
+
+class AsyncDevice:
+    """Async common methods across all ASCOM Alpaca devices.
+
+    Attributes:
+        address (str): Domain name or IP address of Alpaca server.
+            Can also specify port number if needed.
+        device_type (str): One of the recognised ASCOM device types
+            e.g. telescope (must be lower case).
+        device_number (int): Zero based device number as set on the server (0 to
+            4294967295).
+        api_version (int): Alpaca API version.
+        base_url (str): Basic URL to easily append with commands.
+
+    """
+
+    def __init__(
+        self,
+        address: str,
+        device_type: str,
+        device_number: int,
+        protocall: str,
+        api_version: int,
+    ):
+        """Initialize AsyncDevice object."""
+        self.address = address
+        self.device_type = device_type
+        self.device_number = device_number
+        self.api_version = api_version
+        self.base_url = "%s://%s/api/v%d/%s/%d" % (
+            protocall,
+            address,
+            api_version,
+            device_type,
+            device_number,
+        )
+        # Created lazily by _ensure_session(): aiohttp needs a running
+        # event loop, and construction may happen outside any coroutine.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._url_cache: Dict[str, str] = {}
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive session, creating it on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=16, keepalive_timeout=75
+                )
+            )
+        return self._session
+
+    async def get_many(self, attributes: List[str]) -> Dict[str, Any]:
+        """Get several attributes concurrently in one round-trip window.
+
+        Args:
+            attributes (List[str]): Attributes to get from server.
+
+        Returns:
+            Dict mapping each attribute name to its returned value.
+
+        """
+        values = await asyncio.gather(*(self._get(a) for a in attributes))
+        return dict(zip(attributes, values))
+
+    async def close(self):
+        """Close the keep-alive session to the Alpaca server."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Enter context manager that closes the session on exit."""
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit context manager and close the session."""
+        await self.close()
+
+    async def action(self, Action: str, *Parameters):
+        """Access functionality beyond the built-in capabilities of the ASCOM device interfaces."""
+        return (await self._put("action", Action=Action, Parameters=Parameters))[
+            "Value"
+        ]
+
+    async def commandblind(self, Command: str, Raw: bool):
+        """Transmit an arbitrary string to the device and does not wait for a response."""
+        await self._put("commandblind", Command=Command, Raw=Raw)
+
+    async def commandbool(self, Command: str, Raw: bool):
+        """Transmit an arbitrary string to the device and wait for a boolean response."""
+        return (await self._put("commandbool", Command=Command, Raw=Raw))["Value"]
+
+    async def commandstring(self, Command: str, Raw: bool):
+        """Transmit an arbitrary string to the device and wait for a string response."""
+        return (await self._put("commandstring", Command=Command, Raw=Raw))["Value"]
+
+    async def connected(self, Connected: Optional[bool] = None):
+        """Retrieve or set the connected state of the device."""
+        if Connected is None:
+            return await self._get("connected")
+        await self._put("connected", Connected=Connected)
+
+    async def description(self) -> str:
+        """Get description of the device."""
+        return await self._get("description")
+
+    async def driverinfo(self) -> List[str]:
+        """Get information of the device."""
+        return [i.strip() for i in (await self._get("driverinfo")).split(",")]
+
+    async def driverversion(self) -> str:
+        """Get string containing only the major and minor version of the driver."""
+        return await self._get("driverversion")
+
+    async def interfaceversion(self) -> int:
+        """ASCOM Device interface version number that this device supports."""
+        return await self._get("interfaceversion")
+
+    async def name(self) -> str:
+        """Get name of the device."""
+        return await self._get("name")
+
+    async def supportedactions(self) -> List[str]:
+        """Get list of action names supported by this driver."""
+        return await self._get("supportedactions")
+
+    def _url(self, attribute: str) -> str:
+        """Build and cache the full URL for an Alpaca endpoint."""
+        url = self._url_cache.get(attribute)
+        if url is None:
+            url = "%s/%s" % (self.base_url, attribute)
+            self._url_cache[attribute] = url
+        return url
+
+    async def _get(self, attribute: str, **params):
+        """Send an HTTP GET request to an Alpaca server and check response for errors."""
+        session = self._ensure_session()
+        async with session.get(self._url(attribute), params=params) as response:
+            body = await response.json()
+            self._check_error(body, response.status)
+            return body["Value"]
+
+    async def _put(self, attribute: str, **data):
+        """Send an HTTP PUT request to an Alpaca server and check response for errors."""
+        session = self._ensure_session()
+        async with session.put(self._url(attribute), data=data) as response:
+            body = await response.json()
+            self._check_error(body, response.status)
+            return body
+
+    def _check_error(self, body: Mapping[str, Any], status_code: int):
+        """Check parsed response from Alpaca server for errors."""
+        n = body.get("ErrorNumber", 0)
+        if n:
+            raise NumericError(n, body.get("ErrorMessage", ""), status_code)
+        if status_code >= 400:
+            raise ErrorMessage(body.get("Value"), status_code)
+
+
+class AsyncTelescope(AsyncDevice):
+    """Async telescope specific methods."""
+
+    def __init__(
+        self,
+        address: str,
+        device_number: int,
+        protocall: str = "http",
+        api_version: int = DEFAULT_API_VERSION,
+    ):
+        """Initialize AsyncTelescope object."""
+        super().__init__(address, "telescope", device_number, protocall, api_version)
+
+    async def alignmentmode(self):
+        """Return the current mount alignment mode."""
+        return await self._get("alignmentmode")
+
+    async def altitude(self):
+        """Return the mount's Altitude above the horizon."""
+        return await self._get("altitude")
+
+    async def aperturearea(self):
+        """Return the telescope's aperture."""
+        return await self._get("aperturearea")
+
+    async def aperturediameter(self):
+        """Return the telescope's effective aperture."""
+        return await self._get("aperturediameter")
+
+    async def athome(self):
+        """Indicate whether the mount is at the home position."""
+        return await self._get("athome")
+
+    async def atpark(self):
+        """Indicate whether the telescope is at the park position."""
+        return await self._get("atpark")
+
+    async def azimuth(self):
+        """Return the telescope's azimuth."""
+        return await self._get("azimuth")
+
+    async def canfindhome(self):
+        """Indicate whether the mount can find the home position."""
+        return await self._get("canfindhome")
+
+    async def canpark(self):
+        """Indicate whether the telescope can be parked."""
+        return await self._get("canpark")
+
+    async def canpulseguide(self):
+        """Indicate whether the telescope can be pulse guided."""
+        return await self._get("canpulseguide")
+
+    async def cansetdeclinationrate(self):
+        """Indicate whether the DeclinationRate property can be changed."""
+        return await self._get("cansetdeclinationrate")
+
+    async def cansetguiderates(self):
+        """Indicate whether the guide rate properties can be adjusted."""
+        return await self._get("cansetguiderates")
+
+    async def cansetpark(self):
+        """Indicate whether the telescope park position can be set."""
+        return await self._get("cansetpark")
+
+    async def cansetpierside(self):
+        """Indicate whether the telescope SideOfPier can be set."""
+        return await self._get("cansetpierside")
+
+    async def cansetrightascensionrate(self):
+        """Indicate whether the RightAscensionRate property can be changed."""
+        return await self._get("cansetrightascensionrate")
+
+    async def cansettracking(self):
+        """Indicate whether the Tracking property can be changed."""
+        return await self._get("cansettracking")
+
+    async def canslew(self):
+        """Indicate whether the telescope can slew synchronously."""
+        return await self._get("canslew")
+
+    async def canslewaltaz(self):
+        """Indicate whether the telescope can slew synchronously to AltAz coordinates."""
+        return await self._get("canslewaltaz")
+
+    async def canslewaltazasync(self):
+        """Indicate whether the telescope can slew asynchronusly to AltAz coordinates."""
+        return await self._get("canslewaltazasync")
+
+    async def cansync(self):
+        """Indicate whether the telescope can sync to equatorial coordinates."""
+        return await self._get("cansync")
+
+    async def cansyncaltaz(self):
+        """Indicate whether the telescope can sync to local horizontal coordinates."""
+        return await self._get("cansyncaltaz")
+
+    async def declination(self):
+        """Return the telescope's declination."""
+        return await self._get("declination")
+
+    async def declinationrate(self, DeclinationRate: Optional[float] = None):
+        """Set or return the telescope's declination tracking rate."""
+        if DeclinationRate is None:
+            return await self._get("declinationrate")
+        await self._put("declinationrate", DeclinationRate=DeclinationRate)
+
+    async def doesrefraction(self, DoesRefraction: Optional[bool] = None):
+        """Indicate or determine if atmospheric refraction is applied to coordinates."""
+        if DoesRefraction is None:
+            return await self._get("doesrefraction")
+        await self._put("doesrefraction", DoesRefraction=DoesRefraction)
+
+    async def equatorialsystem(self):
+        """Return the current equatorial coordinate system used by this telescope."""
+        return await self._get("equatorialsystem")
+
+    async def focallength(self):
+        """Return the telescope's focal length in meters."""
+        return await self._get("focallength")
+
+    async def guideratedeclination(self, GuideRateDeclination: Optional[float] = None):
+        """Set or return the current Declination rate offset for telescope guiding."""
+        if GuideRateDeclination is None:
+            return await self._get("guideratedeclination")
+        await self._put("guideratedeclination", GuideRateDeclination=GuideRateDeclination)
+
+    async def guideraterightascension(
+        self, GuideRateRightAscension: Optional[float] = None
+    ):
+        """Set or return the current RightAscension rate offset for telescope guiding."""
+        if GuideRateRightAscension is None:
+            return await self._get("guideraterightascension")
+        await self._put(
+            "guideraterightascension", GuideRateRightAscension=GuideRateRightAscension
+        )
+
+    async def ispulseguiding(self):
+        """Indicate whether the telescope is currently executing a PulseGuide command."""
+        return await self._get("ispulseguiding")
+
+    async def rightascension(self):
+        """Return the telescope's right ascension coordinate."""
+        return await self._get("rightascension")
+
+    async def rightascensionrate(self, RightAscensionRate: Optional[float] = None):
+        """Set or return the telescope's right ascension tracking rate."""
+        if RightAscensionRate is None:
+            return await self._get("rightascensionrate")
+        await self._put("rightascensionrate", RightAscensionRate=RightAscensionRate)
+
+    async def sideofpier(self, SideOfPier: Optional[int] = None):
+        """Set or return the mount's pointing state."""
+        if SideOfPier is None:
+            return await self._get("sideofpier")
+        await self._put("sideofpier", SideOfPier=SideOfPier)
+
+    async def siderealtime(self):
+        """Return the local apparent sidereal time."""
+        return await self._get("siderealtime")
+
+    async def siteelevation(self, SiteElevation: Optional[float] = None):
+        """Set or return the observing site's elevation above mean sea level."""
+        if SiteElevation is None:
+            return await self._get("siteelevation")
+        await self._put("siteelevation", SiteElevation=SiteElevation)
+
+    async def sitelatitude(self, SiteLatitude: Optional[float] = None):
+        """Set or return the observing site's latitude."""
+        if SiteLatitude is None:
+            return await self._get("sitelatitude")
+        await self._put("sitelatitude", SiteLatitude=SiteLatitude)
+
+    async def sitelongitude(self, SiteLongitude: Optional[float] = None):
+        """Set or return the observing site's longitude."""
+        if SiteLongitude is None:
+            return await self._get("sitelongitude")
+        await self._put("sitelongitude", SiteLongitude=SiteLongitude)
+
+    async def slewing(self):
+        """Indicate whether the telescope is currently slewing."""
+        return await self._get("slewing")
+
+    async def slewsettletime(self, SlewSettleTime: Optional[int] = None):
+        """Set or return the post-slew settling time."""
+        if SlewSettleTime is None:
+            return await self._get("slewsettletime")
+        await self._put("slewsettletime", SlewSettleTime=SlewSettleTime)
+
+    async def targetdeclination(self, TargetDeclination: Optional[float] = None):
+        """Set or return the target declination of a slew or sync."""
+        if TargetDeclination is None:
+            return await self._get("targetdeclination")
+        await self._put("targetdeclination", TargetDeclination=TargetDeclination)
+
+    async def targetrightascension(self, TargetRightAscension: Optional[float] = None):
+        """Set or return the current target right ascension."""
+        if TargetRightAscension is None:
+            return await self._get("targetrightascension")
+        await self._put("targetrightascension", TargetRightAscension=TargetRightAscension)
+
+    async def tracking(self, Tracking: Optional[bool] = None):
+        """Enable, disable, or indicate whether the telescope is tracking."""
+        if Tracking is None:
+            return await self._get("tracking")
+        await self._put("tracking", Tracking=Tracking)
+
+    async def trackingrate(self, TrackingRate: Optional[int] = None):
+        """Set or return the current tracking rate."""
+        if TrackingRate is None:
+            return await self._get("trackingrate")
+        await self._put("trackingrate", TrackingRate=TrackingRate)
+
+    async def trackingrates(self):
+        """Return a collection of supported DriveRates values."""
+        return await self._get("trackingrates")
+
+    async def utcdate(self, UTCDate: Optional[Union[str, datetime]] = None):
+        """Set or return the UTC date/time of the telescope's internal clock."""
+        if UTCDate is None:
+            return _parse_iso(await self._get("utcdate"))
+
+        if isinstance(UTCDate, str):
+            data = UTCDate
+        elif isinstance(UTCDate, datetime):
+            data = UTCDate.isoformat()
+        else:
+            raise TypeError()
+
+        await self._put("utcdate", UTCDate=data)
+
+    async def abortslew(self):
+        """Immediatley stops a slew in progress."""
+        await self._put("abortslew")
+
+    async def axisrates(self, Axis: int):
+        """Return rates at which the telescope may be moved about the specified axis."""
+        return await self._get("axisrates", Axis=Axis)
+
+    async def canmoveaxis(self, Axis: int):
+        """Indicate whether the telescope can move the requested axis."""
+        return await self._get("canmoveaxis", Axis=Axis)
+
+    async def destinationsideofpier(self, RightAscension: float, Declination: float):
+        """Predict the pointing state after a German equatorial mount slews to given coordinates."""
+        return await self._get(
+            "destinationsideofpier",
+            RightAscension=RightAscension,
+            Declination=Declination,
+        )
+
+    async def findhome(self):
+        """Move the mount to the "home" position."""
+        await self._put("findhome")
+
+    async def moveaxis(self, Axis: int, Rate: float):
+        """Move a telescope axis at the given rate."""
+        await self._put("moveaxis", Axis=Axis, Rate=Rate)
+
+    async def park(self):
+        """Park the mount."""
+        await self._put("park")
+
+    async def pulseguide(self, Direction: int, Duration: int):
+        """Move the scope in the given direction for the given time."""
+        await self._put("pulseguide", Direction=Direction, Duration=Duration)
+
+    async def setpark(self):
+        """Set the telescope's park position."""
+        await self._put("setpark")
+
+    async def slewtoaltaz(self, Azimuth: float, Altitude: float):
+        """Slew synchronously to the given local horizontal coordinates."""
+        await self._put("slewtoaltaz", Azimuth=Azimuth, Altitude=Altitude)
+
+    async def slewtoaltazasync(self, Azimuth: float, Altitude: float):
+        """Slew asynchronously to the given local horizontal coordinates."""
+        await self._put("slewtoaltazasync", Azimuth=Azimuth, Altitude=Altitude)
+
+    async def slewtocoordinates(self, RightAscension: float, Declination: float):
+        """Slew synchronously to the given equatorial coordinates."""
+        await self._put(
+            "slewtocoordinates", RightAscension=RightAscension, Declination=Declination
+        )
+
+    async def slewtocoordinatesasync(self, RightAscension: float, Declination: float):
+        """Slew asynchronously to the given equatorial coordinates."""
+        await self._put(
+            "slewtocoordinatesasync",
+            RightAscension=RightAscension,
+            Declination=Declination,
+        )
+
+    async def slewtotarget(self):
+        """Slew synchronously to the TargetRightAscension and TargetDeclination coordinates."""
+        await self._put("slewtotarget")
+
+    async def slewtotargetasync(self):
+        """Asynchronously slew to the TargetRightAscension and TargetDeclination coordinates."""
+        await self._put("slewtotargetasync")
+
+    async def synctoaltaz(self, Azimuth: float, Altitude: float):
+        """Sync to the given local horizontal coordinates."""
+        await self._put("synctoaltaz", Azimuth=Azimuth, Altitude=Altitude)
+
+    async def synctocoordinates(self, RightAscension: float, Declination: float):
+        """Sync to the given equatorial coordinates."""
+        await self._put(
+            "synctocoordinates", RightAscension=RightAscension, Declination=Declination
+        )
+
+    async def synctotarget(self):
+        """Sync to the TargetRightAscension and TargetDeclination coordinates."""
+        await self._put("synctotarget")
+
+    async def unpark(self):
+        """Unpark the mount."""
+        await self._put("unpark")
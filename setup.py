@@ -13,8 +13,18 @@ setuptools.setup(
     url="https://github.com/EthanChappel/Alpyca",
     version="1.0.0b1",
     license="LICENSE.txt",
-    py_modules=["alpaca"],
-    install_requires=["requests", "python-dateutil"],
+    py_modules=["alpaca", "alpaca_async"],
+    install_requires=["requests"],
+    extras_require={
+        "async": ["aiohttp"],
+        "dateutil": ["python-dateutil"],
+        "http2": ["httpx[http2]"],
+        "cache": ["CacheControl[filecache]"],
+        "msgpack": ["msgpack"],
+        "brotli": ["brotli"],
+        "numpy": ["numpy"],
+        "zstd": ["zstandard", "urllib3>=2"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Development Status :: 4 - Beta",
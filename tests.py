@@ -1,2 +1,43 @@
 """This module contains test cases for Alpyca."""
-from pytest import fixture
+from datetime import timezone
+
+from pytest import mark
+
+from alpaca import _parse_iso
+
+
+class TestParseIso:
+    """Test the ISO-8601 timestamp parser used by utcdate."""
+
+    def test_z_suffix(self):
+        """Parse a Zulu-suffixed timestamp with .NET-tick precision."""
+        parsed = _parse_iso("2016-03-04T17:45:31.1234567Z")
+        assert parsed.year == 2016
+        assert parsed.second == 31
+        assert parsed.tzinfo is not None
+        assert parsed.utcoffset() == timezone.utc.utcoffset(None)
+
+    def test_no_timezone(self):
+        """Parse a naive timestamp without an offset."""
+        parsed = _parse_iso("2016-03-04T17:45:31.123")
+        assert parsed.microsecond == 123000
+        assert parsed.tzinfo is None
+
+    def test_no_fraction(self):
+        """Parse a timestamp without fractional seconds."""
+        parsed = _parse_iso("2016-03-04T17:45:31")
+        assert parsed.minute == 45
+        assert parsed.microsecond == 0
+
+    @mark.parametrize(
+        "value,microsecond",
+        [
+            ("2016-03-04T17:45:31.1Z", 100000),
+            ("2016-03-04T17:45:31.123456Z", 123456),
+            ("2016-03-04T17:45:31.1234567Z", 123456),
+            ("2016-03-04T17:45:31+00:00", 0),
+        ],
+    )
+    def test_fraction_boundaries(self, value, microsecond):
+        """Parse fractional-second fields at their precision boundaries."""
+        assert _parse_iso(value).microsecond == microsecond